@@ -0,0 +1,63 @@
+Feature: Manage the to-do list from the command line
+  Background:
+    Given the command line runs in an empty directory
+
+  Scenario: Tasks persist between commands
+    When the user runs: add "Buy groceries"
+    And the user runs: add "Pay bills"
+    And the user runs: complete 1
+    And the user runs: list
+    Then the command should print:
+      """
+      Tasks:
+      - [x] 1: Buy groceries
+      - [ ] 2: Pay bills
+      """
+
+  Scenario: Clearing does not read the stored tasks
+    Given the task file contains "not valid json"
+    When the user runs: clear
+    Then the command should print:
+      """
+      Cleared all tasks.
+      """
+    When the user runs: list
+    Then the command should print:
+      """
+      No tasks found.
+      """
+
+  Scenario: Completing an unknown task fails
+    When the user runs: complete 7
+    Then the command should fail with exit code 1
+    And the error output should contain "Task with id 7 not found"
+
+  Scenario: Malformed commands are reported by argparse
+    When the user runs: complete abc
+    Then the command should fail with exit code 2
+    And the error output should contain "invalid int value: 'abc'"
+
+  Scenario Outline: The fast path parses common commands like argparse
+    Then the fast parser should match argparse for: <command>
+
+    Examples:
+      | command             |
+      | add "Buy milk"      |
+      | list                |
+      | complete 3          |
+      | update 2 "New name" |
+      | clear               |
+
+  Scenario Outline: The fast path leaves unusual commands to argparse
+    Then the fast parser should defer to argparse for: <command>
+
+    Examples:
+      | command     |
+      | --help      |
+      | add         |
+      | add a b     |
+      | add -x      |
+      | complete x  |
+      | complete -1 |
+      | update 2    |
+      | remove 1    |
@@ -0,0 +1,18 @@
+import os
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from todo_list import TodoList  # noqa: E402
+
+
+def before_all(context):
+    context._todo_template = TodoList(storage_path=None)
+    context._table_cache = {}
+
+
+def before_scenario(context, scenario):
+    context.todo = context._todo_template
+    context.todo.reset()
@@ -0,0 +1,69 @@
+import io
+import os
+import shlex
+import shutil
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from behave import given, then, when
+
+from todo_list import _build_parser, _parse_fast, main
+
+
+@given("the command line runs in an empty directory")
+def step_given_cli_directory(context):
+    tmp_dir = tempfile.mkdtemp()
+    context.add_cleanup(shutil.rmtree, tmp_dir)
+    context.add_cleanup(os.chdir, os.getcwd())
+    os.chdir(tmp_dir)
+
+
+@given('the task file contains "{content}"')
+def step_given_task_file_contents(context, content):
+    Path("todo_data.json").write_text(content, encoding="utf-8")
+
+
+@when("the user runs: {command}")
+def step_when_run_command(context, command):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            context.exit_code = main(shlex.split(command))
+        except SystemExit as exc:
+            context.exit_code = exc.code
+    context.stdout = stdout.getvalue()
+    context.stderr = stderr.getvalue()
+
+
+@then("the command should print:")
+def step_then_command_prints(context):
+    assert context.exit_code == 0, f"Command failed: {context.stderr}"
+    assert context.stdout.strip() == context.text.strip(), (
+        f"Unexpected output:\n{context.stdout}"
+    )
+
+
+@then("the command should fail with exit code {code:d}")
+def step_then_command_fails(context, code):
+    assert context.exit_code == code, f"Expected exit code {code}, got {context.exit_code}"
+
+
+@then('the error output should contain "{text}"')
+def step_then_error_contains(context, text):
+    assert text in context.stderr, f"Expected '{text}' in {context.stderr!r}"
+
+
+@then("the fast parser should match argparse for: {command}")
+def step_then_fast_matches_argparse(context, command):
+    argv = shlex.split(command)
+    fast = _parse_fast(argv)
+    assert fast is not None, f"Expected the fast path to handle {argv}"
+    expected = _build_parser().parse_args(argv)
+    assert fast == expected, f"Fast path gave {fast}, argparse gave {expected}"
+
+
+@then("the fast parser should defer to argparse for: {command}")
+def step_then_fast_defers(context, command):
+    argv = shlex.split(command)
+    assert _parse_fast(argv) is None, f"Expected the fast path to skip {argv}"
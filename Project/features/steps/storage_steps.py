@@ -0,0 +1,98 @@
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from behave import given, then, when
+
+import todo_list
+from todo_list import Task, TodoList
+
+
+UNDECODABLE = b"\xff".decode("utf-8", "surrogateescape")
+
+
+@given("the to-do list is stored in a file")
+def step_given_stored_list(context):
+    tmp_dir = tempfile.mkdtemp()
+    context.add_cleanup(shutil.rmtree, tmp_dir)
+    context.storage_path = Path(tmp_dir) / "todo_data.json"
+    context.todo = TodoList(storage_path=context.storage_path)
+
+
+@given("the task file holds entries:")
+def step_given_task_file_entries(context):
+    entries = [
+        Task(id=int(row["Id"]), title=row["Task"]).to_dict() for row in context.table
+    ]
+    context.storage_path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+
+
+@when("the to-do list is reloaded from the file")
+def step_when_reload(context):
+    context.todo = TodoList(storage_path=context.storage_path)
+
+
+@when('the user adds a task "{title}" ending in an undecodable byte')
+def step_when_add_undecodable(context, title):
+    # Undecodable argv bytes reach Python as lone surrogates.
+    context.todo.add_task(title + UNDECODABLE)
+
+
+@when("the user adds tasks in one batch:")
+def step_when_add_in_batch(context):
+    with context.todo.batch():
+        for row in context.table:
+            context.todo.add_task(row["Task"])
+        context.written_during_batch = context.storage_path.exists()
+
+
+@when('saving fails while the user adds a task "{title}"')
+def step_when_save_fails(context, title):
+    dump_task = todo_list._dump_task
+    dumped = []
+
+    def failing_dump(task):
+        # Fail after the first task so the write is interrupted part way.
+        dumped.append(task)
+        if len(dumped) > 1:
+            raise TypeError("simulated encoding failure")
+        return dump_task(task)
+
+    with mock.patch.object(todo_list, "_dump_task", failing_dump):
+        try:
+            context.todo.add_task(title)
+        except TypeError as exc:
+            context.save_error = exc
+        else:
+            raise AssertionError("Expected the save to fail")
+
+
+@then("the task file should contain tasks:")
+def step_then_file_contains(context):
+    stored = TodoList(storage_path=context.storage_path)
+    expected = [
+        (row["Task"], (row.get("Status") or "Pending").lower())
+        for row in context.table
+    ]
+    actual = [(task.title, task.status) for task in stored.iter_tasks()]
+    assert actual == expected, f"Expected {expected} in the task file, got {actual}"
+
+
+@then("no temporary task file should be left behind")
+def step_then_no_temp_file(context):
+    leftovers = [p.name for p in context.storage_path.parent.iterdir()]
+    assert leftovers == [context.storage_path.name], f"Unexpected files: {leftovers}"
+
+
+@then('the to-do list should contain "{title}" ending in an undecodable byte')
+def step_then_contains_undecodable(context, title):
+    assert context.todo.has_title(title + UNDECODABLE), (
+        f"Expected {title + UNDECODABLE!r} in {[task.title for task in context.todo]}"
+    )
+
+
+@then("the task file should not have been written during the batch")
+def step_then_not_written_in_batch(context):
+    assert not context.written_during_batch, "Expected the save to wait for the batch"
@@ -1,29 +1,44 @@
-import os
 import sys
 
 from behave import given, then, when
 
-ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-if ROOT_DIR not in sys.path:
-    sys.path.insert(0, ROOT_DIR)
-
-from todo_list import TodoList  # noqa: E402
+from todo_list import STATUS_COMPLETED
 
 
 @given("the to-do list is empty")
 def step_given_empty_list(context):
-    context.todo = TodoList(storage_path=None)
+    assert not context.todo, "Expected a fresh to-do list for the scenario"
 
 
 @given("the to-do list contains tasks:")
 def step_given_list_with_tasks(context):
-    context.todo = TodoList(storage_path=None)
-    for row in context.table:
-        title = row.get("Task") or row[0]
-        status = (row.get("Status") or "Pending").lower()
-        task = context.todo.add_task(title)
-        if status == "completed":
-            context.todo.mark_completed(task.id)
+    # The table replaces whatever the list held, as a fresh list would.
+    context.todo.reset()
+    key = tuple(
+        (
+            row.get("Task") or row[0],
+            sys.intern((row.get("Status") or "Pending").lower()),
+        )
+        for row in context.table
+    )
+    records = context._table_cache.get(key)
+    context.table_cache_hit = records is not None
+    if records is not None:
+        context.todo.bulk_load(records)
+        return
+    records = []
+    with context.todo.batch():
+        for title, status in key:
+            task = context.todo.add_task(title)
+            if status is STATUS_COMPLETED:
+                context.todo.mark_completed(task.id)
+            records.append((task.id, task.title, task.status))
+    context._table_cache[key] = records
+
+
+@then("the tasks should have been restored from the table cache")
+def step_then_table_cache_hit(context):
+    assert context.table_cache_hit, "Expected the table to be restored from the cache"
 
 
 @when('the user adds a task "{title}"')
@@ -33,11 +48,8 @@ def step_when_add_task(context, title):
 
 @when("the user lists all tasks")
 def step_when_list_tasks(context):
-    tasks = context.todo.list_tasks()
-    lines = ["Tasks:"]
-    for task in tasks:
-        lines.append(f"- {task.title}")
-    context.list_output = "\n".join(lines)
+    # Formatting is deferred to the output assertion, if any.
+    context.list_output_tasks = list(context.todo.iter_tasks())
 
 
 @when('the user marks task "{title}" as completed')
@@ -59,38 +71,59 @@ def step_when_clear_list(context):
 
 @then('the to-do list should contain "{title}"')
 def step_then_contains_task(context, title):
-    titles = [task.title for task in context.todo.list_tasks()]
-    assert title in titles, f"Expected '{title}' in {titles}"
+    assert context.todo.has_title(title), (
+        f"Expected '{title}' in {[task.title for task in context.todo]}"
+    )
 
 
 @then("the output should contain:")
 def step_then_output_contains(context):
     expected_lines = [line.strip() for line in context.text.strip().splitlines()]
-    actual_lines = [line.strip() for line in context.list_output.strip().splitlines()]
-    for expected in expected_lines:
-        assert expected in actual_lines, f"Expected line '{expected}' not found in output"
+    actual_lines = {f"- {task.title}" for task in context.list_output_tasks}
+    actual_lines.add("Tasks:")
+    missing = [line for line in expected_lines if line not in actual_lines]
+    assert not missing, f"Expected lines not found in output: {missing}"
 
 
 @then('the to-do list should show task "{title}" as completed')
 def step_then_task_completed(context, title):
     task = _find_task_by_title(context.todo, title)
-    assert task.status == "completed", f"Expected '{title}' to be completed, got {task.status}"
+    assert task.status is STATUS_COMPLETED, f"Expected '{title}' to be completed, got {task.status}"
 
 
 @then("the to-do list should be empty")
 def step_then_list_empty(context):
-    assert len(context.todo.list_tasks()) == 0, "Expected the to-do list to be empty"
+    assert len(context.todo) == 0, "Expected the to-do list to be empty"
+
+
+@then("the to-do list should contain {count:d} task")
+@then("the to-do list should contain {count:d} tasks")
+def step_then_task_count(context, count):
+    titles = [task.title for task in context.todo]
+    assert len(titles) == count, f"Expected {count} tasks, got {titles}"
+
+
+@then("the to-do list should have {count:d} completed task")
+@then("the to-do list should have {count:d} completed tasks")
+def step_then_completed_count(context, count):
+    completed = context.todo.completed
+    assert completed == count, f"Expected {count} completed tasks, got {completed}"
 
 
 @then('the to-do list should contain "{title}" after update')
 def step_then_contains_after_update(context, title):
-    titles = [task.title for task in context.todo.list_tasks()]
-    assert title in titles, f"Expected '{title}' in {titles}"
+    step_then_contains_task(context, title)
+
+
+@then('the task "{title}" should have id {task_id:d}')
+def step_then_task_has_id(context, title, task_id):
+    task = _find_task_by_title(context.todo, title)
+    assert task.id == task_id, f"Expected '{title}' to be task {task_id}, got {task.id}"
 
 
 def _find_task_by_title(todo, title):
-    for task in todo.list_tasks():
-        if task.title == title:
-            return task
-    raise AssertionError(f"Task with title '{title}' not found")
+    try:
+        return todo.get_by_title(title)
+    except ValueError:
+        raise AssertionError(f"Task with title '{title}' not found") from None
 
@@ -0,0 +1,57 @@
+Feature: Persist the to-do list
+  Scenario: A failed save keeps the previously stored tasks
+    Given the to-do list is stored in a file
+    And the to-do list contains tasks:
+      | Task          |
+      | Buy groceries |
+      | Pay bills     |
+    When saving fails while the user adds a task "Walk the dog"
+    Then the task file should contain tasks:
+      | Task          |
+      | Buy groceries |
+      | Pay bills     |
+    And no temporary task file should be left behind
+
+  Scenario: Tasks survive a save and reload
+    Given the to-do list is stored in a file
+    And the to-do list contains tasks:
+      | Task          | Status    |
+      | Buy groceries | Pending   |
+      | Pay bills     | Completed |
+    When the user adds a task "Café visit"
+    And the user adds a task "Fix bug" ending in an undecodable byte
+    And the to-do list is reloaded from the file
+    Then the to-do list should show task "Pay bills" as completed
+    And the to-do list should contain "Café visit"
+    And the to-do list should contain "Fix bug" ending in an undecodable byte
+    And the to-do list should have 1 completed task
+
+  Scenario: Changes made in a batch are saved once at the end
+    Given the to-do list is stored in a file
+    When the user adds tasks in one batch:
+      | Task          |
+      | Buy groceries |
+      | Pay bills     |
+    Then the task file should not have been written during the batch
+    And the task file should contain tasks:
+      | Task          |
+      | Buy groceries |
+      | Pay bills     |
+
+  Scenario: Tasks that repeat an id in the file are kept
+    Given the to-do list is stored in a file
+    And the task file holds entries:
+      | Id | Task          |
+      | 1  | Buy groceries |
+      | 1  | Pay bills     |
+    When the to-do list is reloaded from the file
+    Then the to-do list should contain 2 tasks
+    And the task "Buy groceries" should have id 1
+    And the task "Pay bills" should have id 2
+    When the user adds a task "Walk the dog"
+    Then the task "Walk the dog" should have id 3
+    And the task file should contain tasks:
+      | Task          |
+      | Buy groceries |
+      | Pay bills     |
+      | Walk the dog  |
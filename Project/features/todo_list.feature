@@ -39,3 +39,44 @@ Feature: Manage to-do list
     When the user renames task "Buy groceries" to "Buy food"
     Then the to-do list should contain "Buy food"
 
+
+  Scenario: Rename a task to a title that is already taken
+    Given the to-do list contains tasks:
+      | Task          |
+      | Buy groceries |
+      | Pay bills     |
+    When the user renames task "Buy groceries" to "Pay bills"
+    Then the task "Pay bills" should have id 1
+
+  Scenario: Load completed tasks from a table
+    Given the to-do list contains tasks:
+      | Task          | Status    |
+      | Buy groceries | Completed |
+      | Pay bills     | Pending   |
+    Then the to-do list should show task "Buy groceries" as completed
+    And the to-do list should have 1 completed task
+
+  Scenario: Reuse a table that was loaded before
+    Given the to-do list contains tasks:
+      | Task          | Status    |
+      | Buy groceries | Completed |
+      | Pay bills     | Pending   |
+    And the to-do list contains tasks:
+      | Task          | Status    |
+      | Buy groceries | Completed |
+      | Pay bills     | Pending   |
+    Then the tasks should have been restored from the table cache
+    When the user adds a task "Walk the dog"
+    Then the to-do list should show task "Buy groceries" as completed
+    And the task "Walk the dog" should have id 3
+    And the to-do list should have 1 completed task
+
+  Scenario: A later table replaces the tasks from an earlier one
+    Given the to-do list contains tasks:
+      | Task          |
+      | Buy groceries |
+    And the to-do list contains tasks:
+      | Task      |
+      | Pay bills |
+    Then the task "Pay bills" should have id 1
+    And the to-do list should contain 1 task
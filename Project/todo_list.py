@@ -2,47 +2,95 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import BinaryIO, Iterable, Iterator, KeysView, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-@dataclass
+# Statuses are interned so hot paths can compare them by identity.
+STATUS_PENDING = sys.intern("pending")
+STATUS_COMPLETED = sys.intern("completed")
+
+
+@dataclass(slots=True)
 class Task:
     """Simple task model with basic metadata."""
 
     id: int
     title: str
-    status: str = "pending"
+    status: str = STATUS_PENDING
     created_at: datetime = field(default_factory=datetime.utcnow)
     completed_at: Optional[datetime] = None
+    _created_iso: Optional[str] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    _completed_iso: Optional[str] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.status = sys.intern(self.status)
 
-    def mark_completed(self) -> None:
-        self.status = "completed"
-        self.completed_at = datetime.utcnow()
+    def mark_completed(self, completed_at: Optional[datetime] = None) -> None:
+        self.status = STATUS_COMPLETED
+        self.completed_at = completed_at or datetime.utcnow()
+        self._completed_iso = None
 
     def to_dict(self) -> dict:
+        self._created_iso = self._created_iso or self.created_at.isoformat()
+        if self.completed_at and not self._completed_iso:
+            self._completed_iso = self.completed_at.isoformat()
         return {
             "id": self.id,
             "title": self.title,
             "status": self.status,
-            "created_at": self.created_at.isoformat(),
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": self._created_iso,
+            "completed_at": self._completed_iso if self.completed_at else None,
         }
 
     @staticmethod
     def from_dict(data: dict) -> "Task":
-        return Task(
+        task = Task(
             id=int(data["id"]),
             title=data["title"],
-            status=data.get("status", "pending"),
+            status=data.get("status", STATUS_PENDING),
             created_at=datetime.fromisoformat(data["created_at"]),
             completed_at=datetime.fromisoformat(data["completed_at"])
             if data.get("completed_at")
             else None,
         )
+        task._created_iso = data["created_at"]
+        task._completed_iso = data.get("completed_at")
+        return task
+
+
+def _dump_task(task: Task) -> bytes:
+    # orjson writes non-ASCII text as raw UTF-8 where json escapes it as
+    # ``\uXXXX``; both load back the same. orjson rejects lone surrogates
+    # (e.g. undecodable argv bytes), so those tasks go through json.
+    if orjson:
+        try:
+            return orjson.dumps(task.to_dict(), option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(task.to_dict(), indent=2).encode("utf-8")
+
+
+def _loads(data: bytes) -> list:
+    if orjson:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # json also accepts escaped lone surrogates
+    return json.loads(data)
 
 
 class TodoList:
@@ -50,74 +98,234 @@ class TodoList:
 
     def __init__(self, storage_path: Optional[Path] = None) -> None:
         self.storage_path = Path(storage_path) if storage_path else None
-        self._tasks: List[Task] = []
+        # Dicts keep insertion order, so this serves both listing and lookup.
+        self._tasks: dict[int, Task] = {}
+        self._tasks_by_title: dict[str, Task] = {}
         self._next_id = 1
+        self._completed_count = 0
+        self._dirty = False
+        self._batch_depth = 0
+        self._batch_now: Optional[datetime] = None
         if self.storage_path:
             self._load()
 
     def _load(self) -> None:
         if not self.storage_path or not self.storage_path.exists():
             return
-        raw = json.loads(self.storage_path.read_text(encoding="utf-8"))
-        tasks = [Task.from_dict(item) for item in raw]
-        self._tasks = tasks
+        raw = _loads(self.storage_path.read_bytes())
+        self._set_tasks([Task.from_dict(item) for item in raw])
+
+    def _set_tasks(self, tasks: List[Task]) -> None:
         self._next_id = (max((t.id for t in tasks), default=0) or 0) + 1
+        self._tasks = {}
+        self._tasks_by_title = {}
+        for task in tasks:
+            if task.id in self._tasks:
+                # Keep tasks that repeat an id (e.g. a hand-edited file)
+                # under a fresh id rather than dropping them on the next save.
+                task.id = self._next_id
+                self._next_id += 1
+            self._tasks[task.id] = task
+            self._tasks_by_title.setdefault(task.title, task)
+        self._completed_count = sum(1 for t in tasks if t.status is STATUS_COMPLETED)
 
     def _save(self) -> None:
         if not self.storage_path:
             return
-        payload = [task.to_dict() for task in self._tasks]
-        self.storage_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        # Write next to the target and swap it in, so a task that fails to
+        # encode part way through never leaves a truncated file behind.
+        tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+        try:
+            with tmp_path.open("wb", buffering=1 << 16) as handle:
+                self._write_tasks(handle)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, self.storage_path)
+
+    def _write_tasks(self, handle: BinaryIO) -> None:
+        # Emit the array one task at a time so the whole document is never
+        # held in memory; the layout matches ``json.dumps(..., indent=2)``.
+        if not self._tasks:
+            handle.write(b"[]")
+            return
+        separator = b"[\n  "
+        for task in self._tasks.values():
+            handle.write(separator)
+            handle.write(_dump_task(task).replace(b"\n", b"\n  "))
+            separator = b",\n  "
+        handle.write(b"\n]")
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes to storage, if any."""
+        if not self._dirty:
+            return
+        self._save()
+        self._dirty = False
+
+    @contextmanager
+    def batch(self) -> Iterator["TodoList"]:
+        """Defer saving until the outermost batch exits."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._batch_now = None
+                self.flush()
+
+    def _now(self) -> datetime:
+        """Current time, fixed for the duration of the outermost batch."""
+        if not self._batch_depth:
+            return datetime.utcnow()
+        if self._batch_now is None:
+            self._batch_now = datetime.utcnow()
+        return self._batch_now
 
     def add_task(self, title: str) -> Task:
-        if not title.strip():
+        title = title.strip()
+        if not title:
             raise ValueError("Task title cannot be empty")
-        task = Task(id=self._next_id, title=title.strip())
+        task = Task(id=self._next_id, title=title, created_at=self._now())
         self._next_id += 1
-        self._tasks.append(task)
-        self._save()
+        self._tasks[task.id] = task
+        self._tasks_by_title.setdefault(task.title, task)
+        self._mark_dirty()
         return task
 
-    def list_tasks(self) -> List[Task]:
-        return list(self._tasks)
+    def bulk_load(self, records: Iterable[Tuple[int, str, str]]) -> None:
+        """Replace all tasks with ``(id, title, status)`` records."""
+        now = self._now()
+        tasks = []
+        for task_id, title, status in records:
+            task = Task(id=task_id, title=title, created_at=now)
+            if sys.intern(status) is STATUS_COMPLETED:
+                task.mark_completed(now)
+            tasks.append(task)
+        self._set_tasks(tasks)
+        self._mark_dirty()
+
+    def list_tasks(self) -> Tuple[Task, ...]:
+        return tuple(self._tasks.values())
+
+    def iter_tasks(self) -> Iterator[Task]:
+        return iter(self._tasks.values())
+
+    def titles(self) -> KeysView[str]:
+        return self._tasks_by_title.keys()
 
     def mark_completed(self, task_id: int) -> Task:
         task = self._find_task_by_id(task_id)
-        task.mark_completed()
-        self._save()
+        if task.status is not STATUS_COMPLETED:
+            self._completed_count += 1
+        task.mark_completed(self._now())
+        self._mark_dirty()
         return task
 
     def clear(self) -> None:
         self._tasks.clear()
-        self._save()
+        self._tasks_by_title.clear()
+        self._completed_count = 0
+        self._mark_dirty()
+
+    def reset(self) -> None:
+        """Drop all tasks and restart ids without touching storage."""
+        self._tasks.clear()
+        self._tasks_by_title.clear()
+        self._next_id = 1
+        self._completed_count = 0
+        self._dirty = False
 
     def update_task(self, task_id: int, title: str) -> Task:
-        if not title.strip():
+        title = title.strip()
+        if not title:
             raise ValueError("Task title cannot be empty")
         task = self._find_task_by_id(task_id)
-        task.title = title.strip()
-        self._save()
+        old_title = task.title
+        task.title = title
+        self._reindex_title(old_title, task)
+        self._mark_dirty()
         return task
 
+    def get_by_title(self, title: str) -> Task:
+        try:
+            return self._tasks_by_title[title]
+        except KeyError:
+            raise ValueError(f"Task with title '{title}' not found") from None
+
+    def has_title(self, title: str) -> bool:
+        return title in self._tasks_by_title
+
+    def _reindex_title(self, old_title: str, task: Task) -> None:
+        # Titles may repeat; the index always holds the first task in order,
+        # matching what a linear scan would find.
+        if self._tasks_by_title.get(old_title) is task:
+            del self._tasks_by_title[old_title]
+            self._index_first_with_title(old_title)
+        if self._tasks_by_title.setdefault(task.title, task) is not task:
+            self._index_first_with_title(task.title)
+
+    def _index_first_with_title(self, title: str) -> None:
+        for other in self._tasks.values():
+            if other.title == title:
+                self._tasks_by_title[title] = other
+                return
+
     def _find_task_by_id(self, task_id: int) -> Task:
-        for task in self._tasks:
-            if task.id == task_id:
-                return task
-        raise ValueError(f"Task with id {task_id} not found")
+        try:
+            return self._tasks[task_id]
+        except KeyError:
+            raise ValueError(f"Task with id {task_id} not found") from None
+
+    @property
+    def completed(self) -> int:
+        """Number of completed tasks."""
+        return self._completed_count
 
     def __len__(self) -> int:
         return len(self._tasks)
 
     def __iter__(self) -> Iterable[Task]:
-        return iter(self._tasks)
+        return iter(self._tasks.values())
 
 
 def _format_task(task: Task) -> str:
-    marker = "x" if task.status == "completed" else " "
+    marker = "x" if task.status is STATUS_COMPLETED else " "
     return f"[{marker}] {task.id}: {task.title}"
 
 
-def main(argv: Optional[list[str]] = None) -> int:
+_FAST_ARITY = {"add": 1, "list": 0, "complete": 1, "update": 2, "clear": 0}
+
+
+def _parse_fast(argv: list[str]) -> Optional[argparse.Namespace]:
+    """Parse well-formed common commands without building the argparse tree.
+
+    Returns ``None`` for anything unusual (help, options, bad arity or ids)
+    so argparse can handle it and report errors as usual.
+    """
+    if not argv or _FAST_ARITY.get(argv[0]) != len(argv) - 1:
+        return None
+    command, *rest = argv
+    if any(arg.startswith("-") for arg in rest):
+        return None
+    args = argparse.Namespace(command=command)
+    if command in ("complete", "update"):
+        try:
+            args.id = int(rest[0])
+        except ValueError:
+            return None
+    if command in ("add", "update"):
+        args.title = rest[-1]
+    return args
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="To-Do List Manager")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -136,21 +344,42 @@ def main(argv: Optional[list[str]] = None) -> int:
     update_parser.add_argument("title", help="New title for the task")
 
     subparsers.add_parser("clear", help="Clear all tasks")
+    return parser
+
 
-    args = parser.parse_args(argv)
-    todo = TodoList(storage_path=Path("todo_data.json"))
+def _unloaded_list(storage_path: Path) -> TodoList:
+    """Bind an empty list to ``storage_path`` without reading the file.
+
+    Only safe right before a full overwrite such as ``clear``: saving any
+    other change would replace the stored tasks with this list's contents.
+    """
+    todo = TodoList()
+    todo.storage_path = storage_path
+    return todo
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _parse_fast(argv) or _build_parser().parse_args(argv)
+    storage_path = Path("todo_data.json")
+    if args.command == "clear":
+        # ``clear`` overwrites the file, so there is no point parsing it first.
+        todo = _unloaded_list(storage_path)
+    else:
+        todo = TodoList(storage_path=storage_path)
 
     if args.command == "add":
         task = todo.add_task(args.title)
         print(f"Added task {task.id}: {task.title}")
     elif args.command == "list":
-        tasks = todo.list_tasks()
-        if not tasks:
+        if not todo:
             print("No tasks found.")
         else:
-            print("Tasks:")
-            for task in tasks:
-                print(f"- {_format_task(task)}")
+            print(
+                "Tasks:\n"
+                + "\n".join(f"- {_format_task(task)}" for task in todo.iter_tasks())
+            )
     elif args.command == "complete":
         try:
             task = todo.mark_completed(args.id)
@@ -169,7 +398,7 @@ def main(argv: Optional[list[str]] = None) -> int:
         todo.clear()
         print("Cleared all tasks.")
     else:
-        parser.print_help()
+        _build_parser().print_help()
         return 1
     return 0
 